@@ -18,9 +18,12 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 import warnings
 from datetime import datetime, timezone
-from typing import Iterable, Optional
+from operator import attrgetter, methodcaller
+from typing import Hashable, Iterable, Optional, TypeVar
 from uuid import UUID, uuid4
 
+# See https://github.com/package-url/packageurl-python/issues/65
+from packageurl import PackageURL  # type: ignore
 from sortedcontainers import SortedSet
 
 from ..exception.model import UnknownComponentDependencyException
@@ -29,6 +32,18 @@ from . import ExternalReference, LicenseChoice, OrganizationalContact, Organizat
 from .component import Component
 from .service import Service
 
+_get_bom_ref = attrgetter('bom_ref')
+_has_vulnerabilities = methodcaller('has_vulnerabilities')
+
+_T = TypeVar('_T', bound=Hashable)
+
+
+def _sorted_set(items: Iterable[_T]) -> "SortedSet[_T]":
+    # Copying an existing SortedSet reuses the hashes held in its underlying set, rather than re-hashing every item
+    if isinstance(items, SortedSet):
+        return items.copy()
+    return SortedSet(items)
+
 
 class BomMetaData:
     """
@@ -43,9 +58,10 @@ class BomMetaData:
                  manufacture: Optional[OrganizationalEntity] = None,
                  supplier: Optional[OrganizationalEntity] = None,
                  licenses: Optional[Iterable[LicenseChoice]] = None,
-                 properties: Optional[Iterable[Property]] = None) -> None:
-        self.timestamp = datetime.now(tz=timezone.utc)
-        self.tools = tools or []  # type: ignore
+                 properties: Optional[Iterable[Property]] = None,
+                 timestamp: Optional[datetime] = None) -> None:
+        self.timestamp = timestamp or datetime.now(tz=timezone.utc)
+        self.tools = tools or [ThisTool]  # type: ignore
         self.authors = authors or []  # type: ignore
         self.component = component
         self.manufacture = manufacture
@@ -53,9 +69,6 @@ class BomMetaData:
         self.licenses = licenses or []  # type: ignore
         self.properties = properties or []  # type: ignore
 
-        if not tools:
-            self.tools.add(ThisTool)
-
     @property
     def timestamp(self) -> datetime:
         """
@@ -82,7 +95,7 @@ class BomMetaData:
 
     @tools.setter
     def tools(self, tools: Iterable[Tool]) -> None:
-        self._tools = SortedSet(tools)
+        self._tools = _sorted_set(tools)
 
     @property
     def authors(self) -> "SortedSet[OrganizationalContact]":
@@ -100,7 +113,7 @@ class BomMetaData:
 
     @authors.setter
     def authors(self, authors: Iterable[OrganizationalContact]) -> None:
-        self._authors = SortedSet(authors)
+        self._authors = _sorted_set(authors)
 
     @property
     def component(self) -> Optional[Component]:
@@ -168,7 +181,7 @@ class BomMetaData:
 
     @licenses.setter
     def licenses(self, licenses: Iterable[LicenseChoice]) -> None:
-        self._licenses = SortedSet(licenses)
+        self._licenses = _sorted_set(licenses)
 
     @property
     def properties(self) -> "SortedSet[Property]":
@@ -186,20 +199,23 @@ class BomMetaData:
 
     @properties.setter
     def properties(self, properties: Iterable[Property]) -> None:
-        self._properties = SortedSet(properties)
+        self._properties = _sorted_set(properties)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, BomMetaData):
-            return hash(other) == hash(self)
+            return self.timestamp == other.timestamp and self.component == other.component \
+                and self.tools == other.tools
         return False
 
     def __hash__(self) -> int:
         return hash((
-            self.timestamp, self.tools, self.component
+            self.timestamp, tuple(self.tools), self.component
         ))
 
     def __repr__(self) -> str:
-        return f'<BomMetaData timestamp={self.timestamp.utcnow()}>'
+        return f'<BomMetaData timestamp={self.timestamp.isoformat()}>'
 
 
 class Bom:
@@ -238,7 +254,7 @@ class Bom:
             New, empty `cyclonedx.model.bom.Bom` instance.
         """
         self.uuid = uuid4()
-        self.metadata = BomMetaData()
+        self._metadata: Optional[BomMetaData] = None
         self.components = components or []  # type: ignore
         self.services = services or []  # type: ignore
         self.external_references = external_references or []  # type: ignore
@@ -256,18 +272,24 @@ class Bom:
     @uuid.setter
     def uuid(self, uuid: UUID) -> None:
         self.__uuid = uuid
+        self.__urn_uuid: Optional[str] = None
 
     @property
     def metadata(self) -> BomMetaData:
         """
         Get our internal metadata object for this Bom.
 
+        If none has been set, a default `BomMetaData` is created on first access. Its timestamp therefore records
+        when the metadata was first read - usually when the Bom is serialized - rather than when the Bom was created.
+
         Returns:
             Metadata object instance for this Bom.
 
         .. note::
             See the CycloneDX Schema for Bom metadata: https://cyclonedx.org/docs/1.3/#type_metadata
         """
+        if self._metadata is None:
+            self._metadata = BomMetaData()
         return self._metadata
 
     @metadata.setter
@@ -286,7 +308,7 @@ class Bom:
 
     @components.setter
     def components(self, components: Iterable[Component]) -> None:
-        self._components = SortedSet(components)
+        self._components = _sorted_set(components)
 
     def get_component_by_purl(self, purl: Optional[str]) -> Optional[Component]:
         """
@@ -297,12 +319,22 @@ class Bom:
                 Package URL as a `str` to look and find `Component`
 
         Returns:
-            `Component` or `None`
+            `Component` or `None` if no single `Component` has the given PURL
         """
         if purl:
-            found = list(filter(lambda x: x.purl == purl, self.components))
-            if len(found) == 1:
-                return found[0]
+            try:
+                package_url = PackageURL.from_string(purl)
+            except ValueError:
+                return None
+
+            found: Optional[Component] = None
+            for component in self.components:
+                if component.purl == package_url:
+                    if found is not None:
+                        # A PURL shared by more than one Component is ambiguous
+                        return None
+                    found = component
+            return found
 
         return None
 
@@ -313,7 +345,9 @@ class Bom:
         Returns:
             URN formatted UUID that uniquely identified this Bom instance.
         """
-        return 'urn:uuid:{}'.format(self.__uuid)
+        if self.__urn_uuid is None:
+            self.__urn_uuid = f'urn:uuid:{self.__uuid}'
+        return self.__urn_uuid
 
     def has_component(self, component: Component) -> bool:
         """
@@ -340,7 +374,7 @@ class Bom:
 
     @services.setter
     def services(self, services: Iterable[Service]) -> None:
-        self._services = SortedSet(services)
+        self._services = _sorted_set(services)
 
     @property
     def external_references(self) -> "SortedSet[ExternalReference]":
@@ -354,7 +388,7 @@ class Bom:
 
     @external_references.setter
     def external_references(self, external_references: Iterable[ExternalReference]) -> None:
-        self._external_references = SortedSet(external_references)
+        self._external_references = _sorted_set(external_references)
 
     def has_vulnerabilities(self) -> bool:
         """
@@ -364,7 +398,7 @@ class Bom:
             `bool` - `True` if at least one `cyclonedx.model.component.Component` has at least one Vulnerability,
                 `False` otherwise.
         """
-        return any(c.has_vulnerabilities() for c in self.components)
+        return any(map(_has_vulnerabilities, self.components))
 
     def validate(self) -> bool:
         """
@@ -376,15 +410,18 @@ class Bom:
         """
 
         # 1. Make sure dependencies are all in this Bom.
-        all_bom_refs = set([self.metadata.component.bom_ref] if self.metadata.component else []) | set(
-            map(lambda c: c.bom_ref, self.components)) | set(map(lambda s: s.bom_ref, self.services))
-
-        all_dependency_bom_refs = set().union(*(c.dependencies for c in self.components))
-        dependency_diff = all_dependency_bom_refs - all_bom_refs
-        if len(dependency_diff) > 0:
-            raise UnknownComponentDependencyException(
-                f'One or more Components have Dependency references to Components/Services that are not known in this '
-                f'BOM. They are: {dependency_diff}')
+        all_dependency_bom_refs = {d for c in self.components for d in c.dependencies}
+        if all_dependency_bom_refs:
+            # subtract the known bom-refs straight from their iterators, rather than collecting them first
+            dependency_diff = all_dependency_bom_refs.difference(
+                map(_get_bom_ref, self.components), map(_get_bom_ref, self.services)
+            )
+            if self.metadata.component:
+                dependency_diff.discard(self.metadata.component.bom_ref)
+            if len(dependency_diff) > 0:
+                raise UnknownComponentDependencyException(
+                    f'One or more Components have Dependency references to Components/Services that are not known in '
+                    f'this BOM. They are: {dependency_diff}')
 
         # 2. Dependencies should exist for the Component this BOM is describing, if one is set
         if self.metadata.component and not self.metadata.component.dependencies:
@@ -398,8 +435,13 @@ class Bom:
         return True
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Bom):
-            return hash(other) == hash(self)
+            # compare the cheap UUID first, so differing Boms do not walk their collections
+            return self.uuid == other.uuid and self.metadata == other.metadata \
+                and self.components == other.components and self.services == other.services \
+                and self.external_references == other.external_references
         return False
 
     def __hash__(self) -> int:
@@ -58,6 +58,8 @@ class Json(BaseOutput, BaseSchemaVersion):
 
         bom = self.get_bom()
         bom.validate()
+        # Bom creates its default metadata lazily, and the encoder below only serializes what is set on the instance
+        metadata = bom.metadata
 
         schema_uri: Optional[str] = self._get_schema_uri()
         if not schema_uri:
@@ -67,8 +69,8 @@ class Json(BaseOutput, BaseSchemaVersion):
         extras = {}
         if self.bom_supports_dependencies():
             dep_components: Iterable[Component] = bom.components
-            if bom.metadata.component:
-                dep_components = [bom.metadata.component, *dep_components]
+            if metadata.component:
+                dep_components = [metadata.component, *dep_components]
             dependencies = []
             for component in dep_components:
                 dependencies.append({
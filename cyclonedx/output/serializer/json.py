@@ -75,6 +75,8 @@ class CycloneDxJSONEncoder(JSONEncoder):
             return str(o)
 
         # Classes
+        # Only attributes already set on the instance are serialized, so a `Bom` whose `metadata` has never been
+        # read is encoded without it - `output.json.Json` reads `Bom.metadata` before encoding for this reason.
         if isinstance(o, object):
             d: Dict[Any, Any] = {}
             for k, v in o.__dict__.items():
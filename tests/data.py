@@ -20,7 +20,8 @@
 import base64
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, TypeVar
 
 from packageurl import PackageURL
 
@@ -88,15 +89,23 @@ TEST_UUIDS = [
     MOCK_UUID_1, MOCK_UUID_2, MOCK_UUID_3, MOCK_UUID_4, MOCK_UUID_5, MOCK_UUID_6
 ]
 
+SETUPTOOLS_BOM_REF = 'pkg:pypi/setuptools@50.3.2?extension=tar.gz'
+SETUPTOOLS_NO_VERSION_BOM_REF = 'pkg:pypi/setuptools?extension=tar.gz'
+
+
+def _get_bom_with_component_setuptools(**attributes: Any) -> Bom:
+    component = get_component_setuptools_simple()
+    for name, value in attributes.items():
+        setattr(component, name, value)
+    return Bom(components=[component])
+
 
 def get_bom_with_component_setuptools_basic() -> Bom:
-    return Bom(components=[get_component_setuptools_simple()])
+    return _get_bom_with_component_setuptools()
 
 
 def get_bom_with_component_setuptools_with_cpe() -> Bom:
-    component = get_component_setuptools_simple()
-    component.cpe = 'cpe:2.3:a:python:setuptools:50.3.2:*:*:*:*:*:*:*'
-    return Bom(components=[component])
+    return _get_bom_with_component_setuptools(cpe='cpe:2.3:a:python:setuptools:50.3.2:*:*:*:*:*:*:*')
 
 
 def get_bom_with_component_setuptools_no_component_version() -> Bom:
@@ -104,9 +113,7 @@ def get_bom_with_component_setuptools_no_component_version() -> Bom:
 
 
 def get_bom_with_component_setuptools_with_release_notes() -> Bom:
-    component = get_component_setuptools_simple()
-    component.release_notes = get_release_notes()
-    return Bom(components=[component])
+    return _get_bom_with_component_setuptools(release_notes=get_release_notes())
 
 
 def get_bom_with_dependencies_valid() -> Bom:
@@ -172,12 +179,12 @@ def get_bom_with_component_setuptools_with_vulnerability() -> Bom:
         ],
         ratings=[
             VulnerabilityRating(
-                source=get_vulnerability_source_nvd(), score=Decimal(9.8), severity=VulnerabilitySeverity.CRITICAL,
+                source=get_vulnerability_source_nvd(), score=Decimal('9.8'), severity=VulnerabilitySeverity.CRITICAL,
                 method=VulnerabilityScoreSource.CVSS_V3,
                 vector='AN/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H', justification='Some justification'
             ),
             VulnerabilityRating(
-                source=get_vulnerability_source_owasp(), score=Decimal(2.7), severity=VulnerabilitySeverity.LOW,
+                source=get_vulnerability_source_owasp(), score=Decimal('2.7'), severity=VulnerabilitySeverity.LOW,
                 method=VulnerabilityScoreSource.CVSS_V3,
                 vector='AV:L/AC:H/PR:N/UI:R/S:C/C:L/I:N/A:N', justification='Some other justification'
             )
@@ -339,13 +346,17 @@ def get_bom_with_nested_services() -> Bom:
     return bom
 
 
+@lru_cache(maxsize=None)
+def _get_purl_setuptools(version: Optional[str]) -> PackageURL:
+    # PackageURL is immutable, so one instance per version can be shared by every fixture
+    return PackageURL(type='pypi', name='setuptools', version=version, qualifiers='extension=tar.gz')
+
+
 def get_component_setuptools_simple(bom_ref: Optional[str] = None) -> Component:
     return Component(
         name='setuptools', version='50.3.2',
-        bom_ref=bom_ref or 'pkg:pypi/setuptools@50.3.2?extension=tar.gz',
-        purl=PackageURL(
-            type='pypi', name='setuptools', version='50.3.2', qualifiers='extension=tar.gz'
-        ),
+        bom_ref=bom_ref or SETUPTOOLS_BOM_REF,
+        purl=_get_purl_setuptools(version='50.3.2'),
         licenses=[LicenseChoice(license_expression='MIT License')],
         author='Test Author'
     )
@@ -353,10 +364,8 @@ def get_component_setuptools_simple(bom_ref: Optional[str] = None) -> Component:
 
 def get_component_setuptools_simple_no_version(bom_ref: Optional[str] = None) -> Component:
     return Component(
-        name='setuptools', bom_ref=bom_ref or 'pkg:pypi/setuptools?extension=tar.gz',
-        purl=PackageURL(
-            type='pypi', name='setuptools', qualifiers='extension=tar.gz'
-        ),
+        name='setuptools', bom_ref=bom_ref or SETUPTOOLS_NO_VERSION_BOM_REF,
+        purl=_get_purl_setuptools(version=None),
         licenses=[LicenseChoice(license_expression='MIT License')],
         author='Test Author'
     )
@@ -375,6 +384,7 @@ def get_component_toml_with_hashes_with_references(bom_ref: Optional[str] = None
     )
 
 
+@lru_cache(maxsize=None)
 def get_external_reference_1() -> ExternalReference:
     return ExternalReference(
         reference_type=ExternalReferenceType.DISTRIBUTION,
@@ -426,6 +436,7 @@ def get_org_contact_2() -> OrganizationalContact:
     return OrganizationalContact(name='A N Other', email='someone@somewhere.tld', phone='+44 (0)1234 567890')
 
 
+@lru_cache(maxsize=None)
 def get_org_entity_1() -> OrganizationalEntity:
     return OrganizationalEntity(
         name='CycloneDX', urls=[XsUri('https://cyclonedx.org')], contacts=[get_org_contact_1(), get_org_contact_2()]
@@ -458,13 +469,15 @@ def get_pedigree_1() -> Pedigree:
     )
 
 
-def get_properties_1() -> List[Property]:
-    return [
+@lru_cache(maxsize=None)
+def get_properties_1() -> Tuple[Property, ...]:
+    return (
         Property(name='key1', value='val1'),
         Property(name='key2', value='val2')
-    ]
+    )
 
 
+@lru_cache(maxsize=None)
 def get_release_notes() -> ReleaseNotes:
     text_content: str = base64.b64encode(
         bytes('Some simple plain text', encoding='UTF-8')
@@ -522,10 +535,12 @@ def get_swid_2() -> Swid:
     )
 
 
+@lru_cache(maxsize=None)
 def get_vulnerability_source_nvd() -> VulnerabilitySource:
     return VulnerabilitySource(name='NVD', url=XsUri('https://nvd.nist.gov/vuln/detail/CVE-2018-7489'))
 
 
+@lru_cache(maxsize=None)
 def get_vulnerability_source_owasp() -> VulnerabilitySource:
     return VulnerabilitySource(name='OWASP', url=XsUri('https://owasp.org'))
 
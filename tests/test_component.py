@@ -20,7 +20,12 @@
 from os.path import dirname, join
 from unittest import TestCase
 
-from data import get_component_setuptools_simple, get_component_setuptools_simple_no_version
+from data import (
+    SETUPTOOLS_BOM_REF,
+    SETUPTOOLS_NO_VERSION_BOM_REF,
+    get_component_setuptools_simple,
+    get_component_setuptools_simple_no_version,
+)
 
 # See https://github.com/package-url/packageurl-python/issues/65
 from packageurl import PackageURL  # type: ignore
@@ -86,3 +91,34 @@ class TestComponent(TestCase):
         self.assertEqual(len(bom.components), 2)
         self.assertTrue(bom.has_component(component=get_component_setuptools_simple_no_version()))
         self.assertIsNot(get_component_setuptools_simple(), get_component_setuptools_simple_no_version())
+
+    def test_get_component_by_purl(self) -> None:
+        setuptools = get_component_setuptools_simple()
+        bom = Bom(components=[setuptools])
+        self.assertIs(bom.get_component_by_purl(SETUPTOOLS_BOM_REF), setuptools)
+        self.assertIsNone(bom.get_component_by_purl(SETUPTOOLS_NO_VERSION_BOM_REF))
+        self.assertIsNone(bom.get_component_by_purl('pkg:pypi/not-in-bom@1.0.0'))
+        self.assertIsNone(bom.get_component_by_purl('not a purl'))
+
+        # every lookup scans the current components, so it sees additions and removals
+        setuptools_no_version = get_component_setuptools_simple_no_version()
+        bom.components.add(setuptools_no_version)
+        self.assertIs(bom.get_component_by_purl(SETUPTOOLS_NO_VERSION_BOM_REF), setuptools_no_version)
+        bom.components.remove(setuptools)
+        self.assertIsNone(bom.get_component_by_purl(SETUPTOOLS_BOM_REF))
+
+        # ... and PURLs changed in place
+        setuptools_no_version.purl = setuptools.purl
+        self.assertIs(bom.get_component_by_purl(SETUPTOOLS_BOM_REF), setuptools_no_version)
+        self.assertIsNone(bom.get_component_by_purl(SETUPTOOLS_NO_VERSION_BOM_REF))
+
+        # a PURL shared by more than one Component is ambiguous
+        bom.components.add(setuptools)
+        self.assertEqual(len(bom.components), 2)
+        self.assertIsNone(bom.get_component_by_purl(SETUPTOOLS_BOM_REF))
+
+    def test_get_component_by_purl_non_canonical(self) -> None:
+        setuptools = get_component_setuptools_simple()
+        bom = Bom(components=[setuptools])
+        self.assertIs(bom.get_component_by_purl('pkg:PYPI/setuptools@50.3.2?extension=tar.gz'), setuptools)
+        self.assertIs(bom.get_component_by_purl('pkg:pypi/setuptools@50.3.2?extension=tar.gz#'), setuptools)
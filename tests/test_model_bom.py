@@ -18,8 +18,15 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 from unittest import TestCase
+from uuid import UUID
 
-from data import get_bom_with_component_setuptools_with_vulnerability
+from data import (
+    MOCK_TIMESTAMP,
+    MOCK_UUID_1,
+    MOCK_UUID_2,
+    get_bom_with_component_setuptools_basic,
+    get_bom_with_component_setuptools_with_vulnerability,
+)
 
 from cyclonedx.model import License, LicenseChoice, OrganizationalContact, OrganizationalEntity, Property
 from cyclonedx.model.bom import Bom, BomMetaData, ThisTool, Tool
@@ -40,6 +47,19 @@ class TestBomMetaData(TestCase):
         self.assertIsNotNone(metadata.tools)
         self.assertTrue(ThisTool in metadata.tools)
 
+    def test_bom_metadata_hash(self) -> None:
+        metadata = BomMetaData()
+        self.assertEqual(hash(metadata), hash(metadata))
+        self.assertEqual(metadata, metadata)
+
+    def test_bom_metadata_repr(self) -> None:
+        metadata = BomMetaData(timestamp=MOCK_TIMESTAMP)
+        self.assertEqual(repr(metadata), '<BomMetaData timestamp=2021-12-31T10:00:00+00:00>')
+
+    def test_bom_metadata_timestamp(self) -> None:
+        metadata = BomMetaData(timestamp=MOCK_TIMESTAMP)
+        self.assertEqual(metadata.timestamp, MOCK_TIMESTAMP)
+
     def test_basic_bom_metadata(self) -> None:
         tools = [
             Tool(name='tool_1'),
@@ -105,6 +125,12 @@ class TestBom(TestCase):
         self.assertFalse(metadata.component is None)
         self.assertEqual(metadata.component, hextech)
 
+    def test_bom_metadata_set(self) -> None:
+        bom = Bom()
+        metadata = BomMetaData(component=Component(name='test_component'))
+        bom.metadata = metadata
+        self.assertIs(bom.metadata, metadata)
+
     def test_empty_bom(self) -> None:
         bom = Bom()
         self.assertIsNotNone(bom.uuid)
@@ -113,6 +139,52 @@ class TestBom(TestCase):
         self.assertFalse(bom.services)
         self.assertFalse(bom.external_references)
 
+    def test_bom_urn_uuid(self) -> None:
+        bom = Bom()
+        bom.uuid = UUID(MOCK_UUID_1)
+        self.assertEqual(bom.get_urn_uuid(), f'urn:uuid:{MOCK_UUID_1}')
+        bom.uuid = UUID(MOCK_UUID_2)
+        self.assertEqual(bom.get_urn_uuid(), f'urn:uuid:{MOCK_UUID_2}')
+
+    def test_bom_hash(self) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        self.assertEqual(hash(bom), hash(bom))
+        self.assertEqual(bom, bom)
+        self.assertNotEqual(bom, Bom())
+
+    def test_bom_equality(self) -> None:
+        bom_1 = get_bom_with_component_setuptools_with_vulnerability()
+        bom_2 = get_bom_with_component_setuptools_with_vulnerability()
+        bom_2.uuid = bom_1.uuid
+        bom_2.metadata = bom_1.metadata
+        self.assertEqual(bom_1, bom_2)
+        bom_2.components.add(Component(name='test_component'))
+        self.assertNotEqual(bom_1, bom_2)
+
+    def test_bom_components_sorted(self) -> None:
+        # output relies on Bom collections iterating in sorted order, regardless of insertion order
+        components = [
+            Component(name='component-c', component_type=ComponentType.LIBRARY),
+            Component(name='component-a', component_type=ComponentType.LIBRARY),
+            Component(name='component-b', component_type=ComponentType.FILE),
+        ]
+        bom = Bom(components=components[:2])
+        bom.components.add(components[2])
+        self.assertListEqual(list(bom.components), sorted(components))
+
+    def test_bom_components_from_other_bom(self) -> None:
+        bom_1 = get_bom_with_component_setuptools_basic()
+        bom_2 = Bom()
+        bom_2.components = bom_1.components
+        self.assertEqual(bom_2.components, bom_1.components)
+        self.assertIsNot(bom_2.components, bom_1.components)
+        bom_2.components.add(Component(name='test_component'))
+        self.assertEqual(len(bom_1.components), 1)
+
     def test_bom_with_vulnerabilities(self) -> None:
         bom = get_bom_with_component_setuptools_with_vulnerability()
         self.assertTrue(bom.has_vulnerabilities())
+
+    def test_bom_without_vulnerabilities(self) -> None:
+        bom = get_bom_with_component_setuptools_basic()
+        self.assertFalse(bom.has_vulnerabilities())
@@ -17,10 +17,12 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+import json
 from os.path import dirname, join
 from unittest.mock import Mock, patch
 
 from data import (
+    MOCK_TIMESTAMP,
     MOCK_UUID_1,
     MOCK_UUID_2,
     MOCK_UUID_3,
@@ -44,7 +46,7 @@ from data import (
 
 from cyclonedx.exception.model import UnknownComponentDependencyException
 from cyclonedx.exception.output import FormatNotSupportedException
-from cyclonedx.model.bom import Bom
+from cyclonedx.model.bom import Bom, BomMetaData, ThisTool
 from cyclonedx.output import OutputFormat, SchemaVersion, get_instance
 from tests.base import BaseJsonTestCase
 
@@ -334,6 +336,23 @@ class TestOutputJson(BaseJsonTestCase):
                 fixture='bom_dependencies.json'
             )
 
+    def test_bom_v1_4_metadata_timestamp(self) -> None:
+        bom = Bom()
+        bom.metadata = BomMetaData(timestamp=MOCK_TIMESTAMP)
+        outputter = get_instance(bom=bom, output_format=OutputFormat.JSON, schema_version=SchemaVersion.V1_4)
+        bom_json = json.loads(outputter.output_as_string())
+        self.assertEqual(bom_json['metadata']['timestamp'], MOCK_TIMESTAMP.isoformat())
+
+    def test_bom_v1_4_default_metadata(self) -> None:
+        # the default metadata must be output even if nothing else has read it before the Bom is serialized
+        bom = Bom()
+        outputter = get_instance(bom=bom, output_format=OutputFormat.JSON, schema_version=SchemaVersion.V1_4)
+        with patch.object(Bom, 'validate', return_value=True):
+            bom_json = json.loads(outputter.output_as_string())
+        self.assertEqual(bom_json['metadata']['timestamp'], bom.metadata.timestamp.isoformat())
+        self.assertEqual(len(bom_json['metadata']['tools']), 1)
+        self.assertEqual(bom_json['metadata']['tools'][0]['name'], ThisTool.name)
+
     # Helper methods
     def _validate_json_bom(self, bom: Bom, schema_version: SchemaVersion, fixture: str) -> None:
         outputter = get_instance(bom=bom, output_format=OutputFormat.JSON, schema_version=schema_version)
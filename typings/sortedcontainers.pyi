@@ -58,7 +58,7 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     def add(self, value: _T) -> None: ...
     # def _add(self, value: _T) -> None: ...
     # def clear(self) -> None: ...
-    # def copy(self: _SS) -> _SS: ...
+    def copy(self) -> SortedSet[_T]: ...
     # def __copy__(self: _SS) -> _SS: ...
     # def count(self, value: _T) -> int: ...
     def discard(self, value: _T) -> None: ...